@@ -23,11 +23,20 @@ How to Run:
 import tkinter as tk
 from tkinter import ttk, messagebox
 import csv
+import io
+from array import array
 import os
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # --- Configuration ---
 DATA_FILE = 'employees.csv'
+FILE_BUFFER_SIZE = 1 << 20   # 1 MiB buffer for CSV reads/writes
+COMPACT_THRESHOLD = 50       # pending updates/deletes before a full CSV rewrite
+SAVE_DELAY_MS = 250          # saves requested within this window are coalesced
+IO_POLL_MS = 100             # how often the Tk thread checks for finished writes
+FAST_CSV_WRITER = True       # False falls back to the csv module when saving
 TAX_RATE = 0.20          # 20%
 NATIONAL_INSURANCE_RATE = 0.12 # 12%
 PENSION_RATE = 0.05      # 5%
@@ -47,70 +56,130 @@ COLORS = {
     'warning': '#f59e0b'       # Vibrant Amber/Orange
 }
 
+def _safe_float(s):
+    """Converts form input to float, treating blank or invalid text as 0."""
+    s = s.strip()
+    if not s:
+        return 0.0
+    try:
+        return float(s)
+    except ValueError:
+        return 0.0
+
+def _configure_styles():
+    """Configures the shared ttk styles. Call once, after the Tk root exists."""
+    style = ttk.Style()
+    
+    # Configure main styles with proper background
+    style.configure("Modern.TFrame",
+                   background=COLORS['frame_bg'])
+    
+    style.configure("Card.TFrame",
+                   background=COLORS['frame_bg'],
+                   relief="solid",
+                   borderwidth=1)
+    
+    # Fix label styles with proper background
+    style.configure("Modern.TLabel",
+                   font=("Segoe UI", 10),
+                   background=COLORS['frame_bg'],
+                   foreground=COLORS['text'])
+    
+    style.configure("Header.TLabel",
+                   font=("Segoe UI", 12, "bold"),
+                   background=COLORS['frame_bg'],
+                   foreground=COLORS['text'])
+
+    # Fix button style with proper colors
+    style.configure("Modern.TButton",
+                   font=("Segoe UI", 10, "bold"),
+                   padding=(20, 10))
+    
+    style.map("Modern.TButton",
+             foreground=[('pressed', 'white'),
+                        ('active', 'white')],
+             background=[('pressed', COLORS['primary_hover']),
+                        ('active', COLORS['primary'])])
+
+    # Modern entry style
+    style.configure("Modern.TEntry",
+                   fieldbackground=COLORS['frame_bg'],
+                   borderwidth=1)
+
+    # Configure Treeview for modern look
+    style.configure("Modern.Treeview",
+                   background=COLORS['frame_bg'],
+                   fieldbackground=COLORS['frame_bg'],
+                   foreground=COLORS['text'],
+                   rowheight=30,
+                   font=("Segoe UI", 10))
+    
+    style.configure("Modern.Treeview.Heading",
+                   font=("Segoe UI", 10, "bold"),
+                   background=COLORS['bg'],
+                   foreground=COLORS['text'])
+    
+    style.map("Modern.Treeview",
+             background=[('selected', COLORS['tree_selected'])],
+             foreground=[('selected', COLORS['text'])])
+
+@functools.lru_cache(maxsize=None)
+def _slab_bands(slabs):
+    """Turns a tuple of (upper, rate) slabs into (lower, width, rate) bands."""
+    bands = []
+    lower = 0.0
+    for upper, rate in slabs:
+        bands.append((lower, upper - lower, rate))
+        lower = upper
+    return tuple(bands)
+
 class SalaryApp:
+    # Tax slabs and limits (configurable; slabs are tuples of (upper, rate))
+    NEW_REGIME_SLABS = (
+        (300000, 0.0),
+        (600000, 0.05),
+        (900000, 0.10),
+        (1200000, 0.15),
+        (1500000, 0.20),
+        (float('inf'), 0.30),
+    )
+    OLD_REGIME_SLABS = (
+        (250000, 0.0),
+        (500000, 0.05),
+        (1000000, 0.20),
+        (float('inf'), 0.30),
+    )
+    OLD_REBATE_LIMIT = 500000
+    NEW_REBATE_LIMIT = 700000
+    CESS_RATE = 0.04
+
     def __init__(self, root):
         self.root = root
         self.root.title("Salary Management System")
         self.root.geometry("950x600")  # Slightly larger window
         self.root.configure(bg=COLORS['bg'])
 
-        self.employees = self._load_employees()
-
-        # --- Modern Style Configuration ---
-        style = ttk.Style()
-        
-        # Configure main styles with proper background
-        style.configure("Modern.TFrame",
-                       background=COLORS['frame_bg'])
-        
-        style.configure("Card.TFrame",
-                       background=COLORS['frame_bg'],
-                       relief="solid",
-                       borderwidth=1)
-        
-        # Fix label styles with proper background
-        style.configure("Modern.TLabel",
-                       font=("Segoe UI", 10),
-                       background=COLORS['frame_bg'],
-                       foreground=COLORS['text'])
-        
-        style.configure("Header.TLabel",
-                       font=("Segoe UI", 12, "bold"),
-                       background=COLORS['frame_bg'],
-                       foreground=COLORS['text'])
-
-        # Fix button style with proper colors
-        style.configure("Modern.TButton",
-                       font=("Segoe UI", 10, "bold"),
-                       padding=(20, 10))
-        
-        style.map("Modern.TButton",
-                 foreground=[('pressed', 'white'),
-                            ('active', 'white')],
-                 background=[('pressed', COLORS['primary_hover']),
-                            ('active', COLORS['primary'])])
-
-        # Modern entry style
-        style.configure("Modern.TEntry",
-                       fieldbackground=COLORS['frame_bg'],
-                       borderwidth=1)
-
-        # Configure Treeview for modern look
-        style.configure("Modern.Treeview",
-                       background=COLORS['frame_bg'],
-                       fieldbackground=COLORS['frame_bg'],
-                       foreground=COLORS['text'],
-                       rowheight=30,
-                       font=("Segoe UI", 10))
-        
-        style.configure("Modern.Treeview.Heading",
-                       font=("Segoe UI", 10, "bold"),
-                       background=COLORS['bg'],
-                       foreground=COLORS['text'])
-        
-        style.map("Modern.Treeview",
-                 background=[('selected', COLORS['tree_selected'])],
-                 foreground=[('selected', COLORS['text'])])
+        # Employee records are stored column-wise (structure of arrays), sorted by
+        # ID; _id_to_idx maps an employee ID to its position in every column
+        self._ids = array('q')
+        self._names = []
+        self._salaries = array('d')
+        self._salaries_fmt = []
+        self._id_to_idx = {}
+        # Set when DATA_FILE could not be fully loaded; saving would then
+        # overwrite the rows that were not read, so nothing is written
+        self._read_only = False
+        self._load_employees()
+        self._dirty_count = 0  # updates/deletes not yet written to DATA_FILE
+        # Single background writer keeps file I/O off the Tk thread, in order
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        self._io_futures = []  # (future, changes) for writes not yet checked
+        self._io_poll_job = None
+        self._save_pending = False
+        self._save_job = None
+
+        # Write any pending changes before the window closes
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
         # --- Main Frames ---
         # Frame for input form and buttons
@@ -128,28 +197,11 @@ class SalaryApp:
         self._create_input_widgets()
         self._create_button_widgets()
         self._create_treeview_widget()
+        self._create_payslip_window()
+        self._create_tax_window()
         
         self._populate_treeview()
 
-        # Tax slabs and limits (configurable)
-        self.NEW_REGIME_SLABS = [
-            (300000, 0.0),
-            (600000, 0.05),
-            (900000, 0.10),
-            (1200000, 0.15),
-            (1500000, 0.20),
-            (float('inf'), 0.30),
-        ]
-        self.OLD_REGIME_SLABS = [
-            (250000, 0.0),
-            (500000, 0.05),
-            (1000000, 0.20),
-            (float('inf'), 0.30),
-        ]
-        self.OLD_REBATE_LIMIT = 500000
-        self.NEW_REBATE_LIMIT = 700000
-        self.CESS_RATE = 0.04
-
     # --- Widget Creation Methods ---
     def _create_input_widgets(self):
         input_form = ttk.Frame(self.controls_frame, style="Card.TFrame", padding=20)
@@ -254,48 +306,322 @@ class SalaryApp:
         # Bind the selection event to a handler function
         self.tree.bind("<<TreeviewSelect>>", self._on_item_select)
 
+    def _create_popup(self, geometry):
+        """Creates a hidden modal Toplevel that is reused rather than rebuilt."""
+        window = tk.Toplevel(self.root)
+        window.withdraw()
+        window.geometry(geometry)
+        window.configure(bg=COLORS['bg'])
+        window.transient(self.root)
+        # Closing only hides the window so its widgets can be reused
+        window.protocol("WM_DELETE_WINDOW", lambda: self._hide_popup(window))
+        return window
+
+    def _hide_popup(self, window):
+        window.grab_release()
+        window.withdraw()
+
+    def _show_popup(self, window, title):
+        window.title(title)
+        window.deiconify()
+        # Make the window modal (disables interaction with the main window)
+        window.grab_set()
+
+    def _create_payslip_window(self):
+        self._payslip_win = self._create_popup("500x600")
+
+        payslip_frame = ttk.Frame(self._payslip_win, style="Card.TFrame", padding=30)
+        payslip_frame.pack(expand=True, fill="both", padx=20, pady=20)
+
+        # Modern payslip header
+        ttk.Label(payslip_frame, text="PAYSLIP", style="Header.TLabel",
+                 font=("Segoe UI", 16, "bold")).grid(row=0, column=0, columnspan=2, pady=(0, 20))
+
+        labels = [
+            "Date",
+            "Employee ID",
+            "Employee Name",
+            "Gross Salary",
+            "--- DEDUCTIONS ---",
+            f"Tax ({TAX_RATE*100:.0f}%)",
+            f"National Insurance ({NATIONAL_INSURANCE_RATE*100:.0f}%)",
+            f"Pension ({PENSION_RATE*100:.0f}%)",
+            "Total Deductions",
+            "NET SALARY"
+        ]
+
+        self._payslip_value_labels = []
+        for i, label in enumerate(labels):
+            ttk.Label(payslip_frame, text=label, style="Modern.TLabel").grid(row=i+1, column=0, sticky="w", pady=4)
+            value_label = ttk.Label(payslip_frame, style="Modern.TLabel")
+            value_label.grid(row=i+1, column=1, sticky="e", pady=4)
+            self._payslip_value_labels.append(value_label)
+
+    def _create_tax_window(self):
+        self._tax_win = self._create_popup("420x360")
+
+        frame = ttk.Frame(self._tax_win, style="Card.TFrame", padding=15)
+        frame.pack(expand=True, fill="both", padx=10, pady=10)
+
+        labels = [
+            "Gross Salary (annual):",
+            "Other Income (annual):",
+            "Gross Total Income:",
+            "Total Deductions:",
+            "Taxable Income:",
+            "Tax before Cess:",
+            "Cess (4%):",
+            "Total Annual Tax:",
+            "Estimated Monthly TDS:"
+        ]
+
+        self._tax_value_labels = []
+        for i, label in enumerate(labels):
+            ttk.Label(frame, text=label, style="Modern.TLabel").grid(row=i, column=0, sticky="w", pady=4)
+            value_label = ttk.Label(frame, style="Modern.TLabel")
+            value_label.grid(row=i, column=1, sticky="e", pady=4)
+            self._tax_value_labels.append(value_label)
+
+        ttk.Button(frame, text="Close", style="Modern.TButton",
+                   command=lambda: self._hide_popup(self._tax_win)).grid(row=len(labels), column=0, columnspan=2, pady=(10,0))
+
     # --- Data Handling & Business Logic ---
     def _load_employees(self):
         if not os.path.exists(DATA_FILE):
-            return {}
-        employees = {}
+            return
+        employees = {}  # later rows for the same ID win (see _append_employee)
+        bad_lines = []
         try:
-            with open(DATA_FILE, mode='r', newline='', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
+            with open(DATA_FILE, mode='r', newline='', encoding='utf-8', buffering=FILE_BUFFER_SIZE) as file:
+                # Plain list rows with column positions looked up once from the
+                # header; DictReader builds a dict per row
+                reader = csv.reader(file)
+                header = next(reader, None)
+                if header is None:
+                    return
+                id_col = header.index('id')
+                name_col = header.index('name')
+                salary_col = header.index('gross_salary')
                 for row in reader:
-                    employees[int(row['id'])] = {'name': row['name'], 'gross_salary': float(row['gross_salary'])}
+                    if not row:
+                        continue
+                    # Skip unreadable rows (e.g. a torn last line) but keep the rest
+                    try:
+                        emp_id = int(row[id_col])
+                        record = (row[name_col], float(row[salary_col]))
+                    except (ValueError, IndexError):
+                        bad_lines.append(reader.line_num)
+                        continue
+                    if not -2**63 <= emp_id < 2**63:  # range of array('q')
+                        bad_lines.append(reader.line_num)
+                        continue
+                    employees[emp_id] = record
         except Exception as e:
-            messagebox.showerror("Load Error", f"Failed to load data from {DATA_FILE}:\n{e}")
-        return employees
+            # Keep whatever was read before the failure, as the rows are still valid
+            self._read_only = True
+            messagebox.showerror("Load Error", f"Failed to load data from {DATA_FILE}:\n{e}\n\n"
+                                 "Changes will not be saved this session.")
+        for emp_id, (name, gross_salary) in sorted(employees.items()):
+            self._set_employee(emp_id, name, gross_salary)
+        if bad_lines:
+            self._read_only = True
+            messagebox.showerror("Load Error",
+                                 f"Skipped unreadable rows in {DATA_FILE} (lines "
+                                 f"{', '.join(map(str, bad_lines))}).\n\n"
+                                 "Fix the file and restart; changes will not be saved this session.")
+
+    def _set_employee(self, emp_id, name, gross_salary):
+        """Adds or updates an employee record. New IDs must be the largest so far."""
+        # Display string is formatted once when the salary is set, not per redraw
+        gross_salary_fmt = f"{gross_salary:,.2f}"
+        idx = self._id_to_idx.get(emp_id)
+        if idx is None:
+            self._ids.append(emp_id)
+            self._id_to_idx[emp_id] = len(self._ids) - 1
+            self._names.append(name)
+            self._salaries.append(gross_salary)
+            self._salaries_fmt.append(gross_salary_fmt)
+        else:
+            self._names[idx] = name
+            self._salaries[idx] = gross_salary
+            self._salaries_fmt[idx] = gross_salary_fmt
+
+    def _remove_employee(self, emp_id):
+        idx = self._id_to_idx.pop(emp_id)
+        del self._ids[idx]
+        del self._names[idx]
+        del self._salaries[idx]
+        del self._salaries_fmt[idx]
+        # Shift the positions of everyone after the removed row
+        for i in range(idx, len(self._ids)):
+            self._id_to_idx[self._ids[i]] = i
+
+    def _save_employees_sync(self, ids, names, salaries):
+        """Rewrites DATA_FILE from the given column snapshot. Runs on the I/O worker."""
+        # The whole payload is built in memory first and written with one call
+        if FAST_CSV_WRITER:
+            # The schema is fixed, so build each line directly; only names can need
+            # quoting. Output matches csv.writer's default dialect byte for byte.
+            parts = ['id,name,gross_salary\r\n']
+            for emp_id, name, salary in zip(ids, names, salaries):
+                if ',' in name or '"' in name or '\n' in name or '\r' in name:
+                    name = '"' + name.replace('"', '""') + '"'
+                parts.append(f"{emp_id},{name},{salary!r}\r\n")
+            payload = ''.join(parts)
+        else:
+            buf = io.StringIO()
+            writer = csv.writer(buf)
+            writer.writerow(('id', 'name', 'gross_salary'))
+            writer.writerows(zip(ids, names, salaries))
+            payload = buf.getvalue()
+
+        # Write to a temp file and rename it over DATA_FILE: the rename is atomic,
+        # so a crash mid-write never leaves a truncated file and no fsync is needed
+        tmp_file = DATA_FILE + '.tmp'
+        with open(tmp_file, mode='w', newline='', encoding='utf-8', buffering=FILE_BUFFER_SIZE) as file:
+            file.write(payload)
+        os.replace(tmp_file, DATA_FILE)
+
+    def _append_employee_sync(self, row):
+        """Appends a single (id, name, gross_salary) row. Runs on the I/O worker."""
+        with open(DATA_FILE, mode='a', newline='', encoding='utf-8', buffering=FILE_BUFFER_SIZE) as file:
+            csv.writer(file).writerow(row)
+
+    def _submit_io(self, changes, fn, *args):
+        """Queues a write on the I/O worker.
+
+        `changes` is the number of pending changes the write covers; they are
+        added back to _dirty_count if it fails. Results are checked on the Tk
+        thread by _poll_io, since Tk must not be called from the worker.
+        """
+        self._io_futures.append((self._io_pool.submit(fn, *args), changes))
+        if self._io_poll_job is None:
+            self._io_poll_job = self.root.after(IO_POLL_MS, self._poll_io)
+
+    def _poll_io(self):
+        self._io_poll_job = None
+        self._check_io()
+        if self._io_futures:
+            self._io_poll_job = self.root.after(IO_POLL_MS, self._poll_io)
+
+    def _check_io(self):
+        """Handles finished writes; a failed write leaves its changes pending."""
+        pending = []
+        errors = []
+        for future, changes in self._io_futures:
+            if not future.done():
+                pending.append((future, changes))
+                continue
+            error = future.exception()
+            if error is not None:
+                self._dirty_count += changes
+                errors.append(error)
+        # Update state before showing dialogs: showerror runs a nested event loop
+        # in which _poll_io or _flush_save may run and touch _io_futures
+        self._io_futures = pending
+        for error in errors:
+            messagebox.showerror("Save Error", f"Failed to save data to {DATA_FILE}:\n{error}")
 
     def _save_employees(self):
-        try:
-            with open(DATA_FILE, mode='w', newline='', encoding='utf-8') as file:
-                fieldnames = ['id', 'name', 'gross_salary']
-                writer = csv.DictWriter(file, fieldnames=fieldnames)
-                writer.writeheader()
-                for emp_id, data in self.employees.items():
-                    writer.writerow({'id': emp_id, **data})
-        except Exception as e:
-            messagebox.showerror("Save Error", f"Failed to save data to {DATA_FILE}:\n{e}")
+        """Snapshots the employees and rewrites DATA_FILE in the background."""
+        if self._read_only:
+            return
+        # Even with no recorded changes, a failed rewrite must be redone
+        changes = max(self._dirty_count, 1)
+        self._dirty_count = 0
+        self._submit_io(changes, self._save_employees_sync,
+                        array('q', self._ids), list(self._names), array('d', self._salaries))
+
+    def _append_employee(self, emp_id):
+        """Appends a single employee row instead of rewriting the whole file."""
+        if self._read_only:
+            return
+        if not os.path.exists(DATA_FILE):
+            self._request_save()
+            return
+        idx = self._id_to_idx[emp_id]
+        # Counts as one pending change: if the append fails, the next compaction
+        # or the window close rewrites the whole file with this employee in it
+        self._submit_io(1, self._append_employee_sync, (emp_id, self._names[idx], self._salaries[idx]))
+
+    def _mark_dirty(self):
+        """Records an update/delete; the file is compacted once enough pile up."""
+        self._dirty_count += 1
+        if self._dirty_count > COMPACT_THRESHOLD:
+            self._request_save()
+
+    def _request_save(self):
+        """Schedules a full save; repeated requests within SAVE_DELAY_MS share one write."""
+        if self._save_pending:
+            return
+        self._save_pending = True
+        self._save_job = self.root.after(SAVE_DELAY_MS, self._flush_save)
+
+    def _flush_save(self):
+        self._save_pending = False
+        self._save_job = None
+        self._save_employees()
+
+    def _on_close(self):
+        """Flushes pending changes to disk and closes the application."""
+        # Let queued writes finish, then write any remaining changes directly
+        if self._save_job is not None:
+            self.root.after_cancel(self._save_job)
+            self._save_job = None
+        if self._io_poll_job is not None:
+            self.root.after_cancel(self._io_poll_job)
+            self._io_poll_job = None
+        self._io_pool.shutdown(wait=True)
+        self._check_io()
+        if not self._read_only and (self._save_pending or self._dirty_count):
+            try:
+                self._save_employees_sync(self._ids, self._names, self._salaries)
+            except Exception as e:
+                # Deferred updates/deletes exist only in memory, so let the user
+                # keep the window open and retry instead of losing them
+                if not messagebox.askyesno(
+                        "Save Error",
+                        f"Failed to save data to {DATA_FILE}:\n{e}\n\n"
+                        "Quit without saving? Unsaved changes will be lost."):
+                    self._save_pending = False
+                    self._dirty_count = max(self._dirty_count, 1)
+                    self._io_pool = ThreadPoolExecutor(max_workers=1)
+                    return
+        self.root.destroy()
 
     def _get_next_id(self):
-        if not self.employees:
-            return 1
-        return max(self.employees.keys()) + 1
+        # IDs are kept sorted, so the last one is the largest
+        return self._ids[-1] + 1 if self._ids else 1
         
     def _populate_treeview(self):
-        """Clears and re-populates the employee list from the data dictionary."""
+        """Clears and re-populates the employee list from the employee columns.
+
+        Only needed on initial load; later changes go through the _tree_* helpers.
+        """
         # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tree.delete(*self.tree.get_children())
             
-        # Add new items from the employees dictionary, sorted by ID
-        for emp_id in sorted(self.employees.keys()):
-            data = self.employees[emp_id]
-            # Format salary to 2 decimal places for display
-            formatted_salary = f"{data['gross_salary']:,.2f}"
-            self.tree.insert("", "end", values=(emp_id, data['name'], formatted_salary))
+        # Hide the tree while inserting so Tk lays it out once, not per row
+        self.tree.grid_remove()
+        # Columns are already sorted by ID. Each row's item id is the employee
+        # ID, so selections map back to an employee without reading values
+        for row in zip(self._ids, self._names, self._salaries_fmt):
+            self.tree.insert("", "end", iid=str(row[0]), values=row)
+        self.tree.grid()
+
+    def _tree_row(self, emp_id):
+        idx = self._id_to_idx[emp_id]
+        return (emp_id, self._names[idx], self._salaries_fmt[idx])
+
+    def _tree_add(self, emp_id):
+        # New IDs are always the largest, so appending keeps the list sorted
+        self.tree.insert("", "end", iid=str(emp_id), values=self._tree_row(emp_id))
+
+    def _tree_update(self, emp_id):
+        self.tree.item(str(emp_id), values=self._tree_row(emp_id))
+
+    def _tree_delete(self, emp_id):
+        self.tree.delete(str(emp_id))
 
     # --- Event Handlers and Button Commands ---
     def _on_item_select(self, event):
@@ -305,16 +631,13 @@ class SalaryApp:
             return
             
         selected_item = selected_items[0]
-        emp_id = int(self.tree.item(selected_item)["values"][0])
+        emp_id = int(selected_item)
         
-        employee_data = self.employees.get(emp_id)
-        if employee_data:
-            self.name_var.set(employee_data['name'])
+        idx = self._id_to_idx.get(emp_id)
+        if idx is not None:
+            self.name_var.set(self._names[idx])
             # Populate basic pay from stored gross_salary (approximate)
-            try:
-                basic_month = float(employee_data.get('gross_salary', 0.0)) / 12.0
-            except Exception:
-                basic_month = 0.0
+            basic_month = self._salaries[idx] / 12.0
             self.basic_var.set(f"{basic_month:.2f}")
             # HRA and other allowances are not stored separately; reset to 0
             self.hra_var.set("0")
@@ -351,15 +674,9 @@ class SalaryApp:
         try:
             name = self.name_var.get().strip()
             # compute gross salary from monthly components
-            def to_float_val(var):
-                try:
-                    return float(var.get())
-                except Exception:
-                    return 0.0
-
-            basic_month = to_float_val(self.basic_var)
-            hra_month = to_float_val(self.hra_var)
-            other_allow_month = to_float_val(self.other_allow_var)
+            basic_month = _safe_float(self.basic_var.get())
+            hra_month = _safe_float(self.hra_var.get())
+            other_allow_month = _safe_float(self.other_allow_var.get())
 
             if not name:
                 messagebox.showerror("Input Error", "Employee name is required.")
@@ -382,10 +699,10 @@ class SalaryApp:
             gross_annual = (basic_month + hra_month + other_allow_month) * 12.0
 
             emp_id = self._get_next_id()
-            self.employees[emp_id] = {'name': name, 'gross_salary': gross_annual}
+            self._set_employee(emp_id, name, gross_annual)
             
-            self._save_employees()
-            self._populate_treeview()
+            self._append_employee(emp_id)
+            self._tree_add(emp_id)
             self._clear_form()
             messagebox.showinfo("Success", f"Employee '{name}' added successfully with ID {emp_id}.")
             
@@ -399,19 +716,13 @@ class SalaryApp:
             messagebox.showerror("Selection Error", "Please select an employee from the list to update.")
             return
 
-        emp_id = int(self.tree.item(selected_items[0])["values"][0])
+        emp_id = int(selected_items[0])
         
         name = self.name_var.get().strip()
         # compute gross salary from monthly components
-        def to_float_val(var):
-            try:
-                return float(var.get())
-            except Exception:
-                return 0.0
-
-        basic_month = to_float_val(self.basic_var)
-        hra_month = to_float_val(self.hra_var)
-        other_allow_month = to_float_val(self.other_allow_var)
+        basic_month = _safe_float(self.basic_var.get())
+        hra_month = _safe_float(self.hra_var.get())
+        other_allow_month = _safe_float(self.other_allow_var.get())
 
         if not name or (basic_month <= 0 and hra_month <= 0 and other_allow_month <= 0):
             messagebox.showerror("Input Error", "Both name and at least one salary component are required.")
@@ -419,9 +730,9 @@ class SalaryApp:
 
         gross_annual = (basic_month + hra_month + other_allow_month) * 12.0
         
-        self.employees[emp_id] = {'name': name, 'gross_salary': gross_annual}
-        self._save_employees()
-        self._populate_treeview()
+        self._set_employee(emp_id, name, gross_annual)
+        self._mark_dirty()
+        self._tree_update(emp_id)
         self._clear_form()
         messagebox.showinfo("Success", f"Employee ID {emp_id} updated successfully.")
 
@@ -432,13 +743,13 @@ class SalaryApp:
             messagebox.showerror("Selection Error", "Please select an employee to delete.")
             return
 
-        emp_id = int(self.tree.item(selected_items[0])["values"][0])
-        name = self.employees[emp_id]['name']
+        emp_id = int(selected_items[0])
+        name = self._names[self._id_to_idx[emp_id]]
 
         if messagebox.askyesno("Confirm Deletion", f"Are you sure you want to delete {name} (ID: {emp_id})?"):
-            del self.employees[emp_id]
-            self._save_employees()
-            self._populate_treeview()
+            self._remove_employee(emp_id)
+            self._mark_dirty()
+            self._tree_delete(emp_id)
             self._clear_form()
             messagebox.showinfo("Success", f"Employee {name} has been deleted.")
 
@@ -450,96 +761,66 @@ class SalaryApp:
                 messagebox.showerror("Selection Error", "Please select an employee to generate a payslip.")
                 return
 
-            emp_id = int(self.tree.item(selected_items[0])["values"][0])
-            employee = self.employees[emp_id]
+            emp_id = int(selected_items[0])
+            idx = self._id_to_idx[emp_id]
+            name = self._names[idx]
 
-            # Create payslip window with error handling
+            # Add error handling for calculations
             try:
-                payslip_window = tk.Toplevel(self.root)
-                payslip_window.title(f"Payslip for {employee['name']}")
-                payslip_window.geometry("500x600")
-                payslip_window.configure(bg=COLORS['bg'])
-                
-                # Ensure window is created as modal
-                payslip_window.transient(self.root)
-                payslip_window.grab_set()
-                
-                # Add error handling for calculations
-                gross_salary = float(employee['gross_salary'])
+                gross_salary = self._salaries[idx]
                 tax = gross_salary * TAX_RATE
                 ni = gross_salary * NATIONAL_INSURANCE_RATE
                 pension = gross_salary * PENSION_RATE
                 total_deductions = tax + ni + pension
                 net_salary = gross_salary - total_deductions
 
-                payslip_frame = ttk.Frame(payslip_window, style="Card.TFrame", padding=30)
-                payslip_frame.pack(expand=True, fill="both", padx=20, pady=20)
-
-                # Modern payslip header
-                ttk.Label(payslip_frame, text="PAYSLIP", style="Header.TLabel",
-                         font=("Segoe UI", 16, "bold")).grid(row=0, column=0, columnspan=2, pady=(0, 20))
-
-                content = [
-                    ("Date", datetime.now().strftime('%Y-%m-%d')),
-                    ("Employee ID", emp_id),
-                    ("Employee Name", employee['name']),
-                    ("Gross Salary", f"{gross_salary:,.2f}"),
-                    ("--- DEDUCTIONS ---", ""),
-                    (f"Tax ({TAX_RATE*100:.0f}%)", f"({tax:,.2f})"),
-                    (f"National Insurance ({NATIONAL_INSURANCE_RATE*100:.0f}%)", f"({ni:,.2f})"),
-                    (f"Pension ({PENSION_RATE*100:.0f}%)", f"({pension:,.2f})"),
-                    ("Total Deductions", f"({total_deductions:,.2f})"),
-                    ("NET SALARY", f"{net_salary:,.2f}")
+                values = [
+                    datetime.now().strftime('%Y-%m-%d'),
+                    emp_id,
+                    name,
+                    f"{gross_salary:,.2f}",
+                    "",
+                    f"({tax:,.2f})",
+                    f"({ni:,.2f})",
+                    f"({pension:,.2f})",
+                    f"({total_deductions:,.2f})",
+                    f"{net_salary:,.2f}"
                 ]
 
-                for i, (label, value) in enumerate(content):
-                    ttk.Label(payslip_frame, text=label, style="Modern.TLabel").grid(row=i+1, column=0, sticky="w", pady=4)
-                    ttk.Label(payslip_frame, text=value, style="Modern.TLabel").grid(row=i+1, column=1, sticky="e", pady=4)
-                
-                # Make the window modal (disables interaction with the main window)
-                payslip_window.transient(self.root)
-                payslip_window.grab_set()
-                self.root.wait_window(payslip_window)
+                # Only the values change; the cached window's widgets are reused
+                for value_label, value in zip(self._payslip_value_labels, values):
+                    value_label.configure(text=value)
+
+                self._show_popup(self._payslip_win, f"Payslip for {name}")
 
             except Exception as e:
                 messagebox.showerror("Payslip Error", f"Error generating payslip:\n{str(e)}")
-                if payslip_window:
-                    payslip_window.destroy()
+                self._hide_popup(self._payslip_win)
                     
         except Exception as e:
             messagebox.showerror("Error", f"An unexpected error occurred:\n{str(e)}")
 
     # --- New methods for tax computation ---
-    def _compute_tax_from_slabs(self, taxable_income, slabs):
+    def _compute_tax_from_slabs(self, taxable_income, regime):
+        slabs = self.NEW_REGIME_SLABS if regime == "new" else self.OLD_REGIME_SLABS
+        # Bands are cached per slab table, so overridden slabs are picked up too
         tax = 0.0
-        lower = 0.0
-        remaining = taxable_income
-        for upper, rate in slabs:
-            slab_amount = max(0.0, min(upper - lower, remaining))
-            if slab_amount <= 0:
-                lower = upper
-                continue
-            tax += slab_amount * rate
-            remaining -= slab_amount
-            lower = upper
-            if remaining <= 0:
+        for lower, width, rate in _slab_bands(slabs):
+            amount = taxable_income - lower
+            # Bands are ascending, so nothing above this one applies either
+            if amount <= 0:
                 break
+            tax += (width if amount > width else amount) * rate
         return tax
 
     def _calculate_tax(self):
         """Calculate annual tax estimate and show a breakdown to the user."""
         try:
             # Read and validate numeric inputs (monthly inputs converted to annual)
-            def to_float(var):
-                try:
-                    return float(var.get())
-                except Exception:
-                    return 0.0
-
-            basic_month = to_float(self.basic_var)
-            hra_month = to_float(self.hra_var)
-            other_allow_month = to_float(self.other_allow_var)
-            other_income = to_float(self.other_income_var)
+            basic_month = _safe_float(self.basic_var.get())
+            hra_month = _safe_float(self.hra_var.get())
+            other_allow_month = _safe_float(self.other_allow_var.get())
+            other_income = _safe_float(self.other_income_var.get())
 
             basic_annual = basic_month * 12
             hra_annual = hra_month * 12
@@ -549,9 +830,9 @@ class SalaryApp:
             gross_total_income = gross_salary + other_income
 
             # deductions
-            std_ded = to_float(self.std_ded_var)
-            sec80c = to_float(self.sec80c_var)
-            sec80d = to_float(self.sec80d_var)
+            std_ded = _safe_float(self.std_ded_var.get())
+            sec80c = _safe_float(self.sec80c_var.get())
+            sec80d = _safe_float(self.sec80d_var.get())
 
             total_deductions = std_ded + sec80c + sec80d
             taxable_income = max(0.0, gross_total_income - total_deductions)
@@ -559,13 +840,12 @@ class SalaryApp:
             # choose regime slabs
             regime = self.regime_var.get()
             if regime == "new":
-                slabs = self.NEW_REGIME_SLABS
                 rebate_limit = self.NEW_REBATE_LIMIT
             else:
-                slabs = self.OLD_REGIME_SLABS
+                regime = "old"
                 rebate_limit = self.OLD_REBATE_LIMIT
 
-            tax_before_cess = self._compute_tax_from_slabs(taxable_income, slabs)
+            tax_before_cess = self._compute_tax_from_slabs(taxable_income, regime)
 
             # rebate u/s87A (basic handling)
             rebate = 0.0
@@ -579,40 +859,29 @@ class SalaryApp:
             # monthly TDS estimate
             monthly_tds = total_tax / 12.0
 
-            # Show results in a modal window
-            result_win = tk.Toplevel(self.root)
-            result_win.title("Tax Estimate")
-            result_win.geometry("420x360")
-            result_win.transient(self.root)
-            result_win.grab_set()
-
-            frame = ttk.Frame(result_win, style="Card.TFrame", padding=15)
-            frame.pack(expand=True, fill="both", padx=10, pady=10)
-
-            rows = [
-                ("Gross Salary (annual):", f"₹{gross_salary:,.2f}"),
-                ("Other Income (annual):", f"₹{other_income:,.2f}"),
-                ("Gross Total Income:", f"₹{gross_total_income:,.2f}"),
-                ("Total Deductions:", f"₹{total_deductions:,.2f}"),
-                ("Taxable Income:", f"₹{taxable_income:,.2f}"),
-                ("Tax before Cess:", f"₹{tax_before_cess:,.2f}"),
-                ("Cess (4%):", f"₹{cess:,.2f}"),
-                ("Total Annual Tax:", f"₹{total_tax:,.2f}"),
-                ("Estimated Monthly TDS:", f"₹{monthly_tds:,.2f}")
+            # Show results in the cached modal window
+            values = [
+                f"₹{gross_salary:,.2f}",
+                f"₹{other_income:,.2f}",
+                f"₹{gross_total_income:,.2f}",
+                f"₹{total_deductions:,.2f}",
+                f"₹{taxable_income:,.2f}",
+                f"₹{tax_before_cess:,.2f}",
+                f"₹{cess:,.2f}",
+                f"₹{total_tax:,.2f}",
+                f"₹{monthly_tds:,.2f}"
             ]
 
-            for i, (label, val) in enumerate(rows):
-                ttk.Label(frame, text=label, style="Modern.TLabel").grid(row=i, column=0, sticky="w", pady=4)
-                ttk.Label(frame, text=val, style="Modern.TLabel").grid(row=i, column=1, sticky="e", pady=4)
-
-            ttk.Button(frame, text="Close", style="Modern.TButton", command=result_win.destroy).grid(row=len(rows), column=0, columnspan=2, pady=(10,0))
+            for value_label, value in zip(self._tax_value_labels, values):
+                value_label.configure(text=value)
 
-            self.root.wait_window(result_win)
+            self._show_popup(self._tax_win, "Tax Estimate")
 
         except Exception as e:
             messagebox.showerror("Calculation Error", f"Error while calculating tax:\n{e}")
 
 if __name__ == "__main__":
     root = tk.Tk()
+    _configure_styles()
     app = SalaryApp(root)
     root.mainloop()
\ No newline at end of file
@@ -1,13 +0,0 @@
-COLORS = {
-    'bg': '#f9fafb',           # Very Light Grey (Almost White)
-    'frame_bg': '#ffffff',     # Pure White
-    'primary': '#06b6d4',      # Modern Teal/Cyan
-    'primary_hover': '#0891b2', # Darker Teal
-    'text': '#1f2937',         # Dark Slate Grey
-    'text_light': '#6b7280',   # Medium Grey
-    'border': '#e5e7eb',       # Very Light Grey Border
-    'tree_selected': '#ccfbf1', # Very Light Mint/Cyan Selection
-    'success': '#10b981',      # Green
-    'error': '#dc2626',        # Bright Red
-    'warning': '#f59e0b'       # Vibrant Amber/Orange
-}